@@ -10,29 +10,285 @@ Para usar no Alexa Developer Console (Alexa-hosted):
 4. Configure OPENAI_API_KEY em Settings > Environment Variables
 """
 
+from __future__ import annotations
+
+import asyncio
+import atexit
+import collections
+import hashlib
 import os
-import json
 import logging
-import urllib.request
-import urllib.error
-from typing import Optional
+import logging.handlers
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Optional
+
+import aiohttp
+import httpx
+import orjson
 
 import ask_sdk_core.utils as ask_utils
-from ask_sdk_core.skill_builder import SkillBuilder
 from ask_sdk_core.dispatch_components import (
     AbstractRequestHandler,
     AbstractExceptionHandler
 )
-from ask_sdk_core.handler_input import HandlerInput
-from ask_sdk_model import Response
+
+if TYPE_CHECKING:
+    # Annotation-only imports: with postponed annotation evaluation these
+    # submodules (and the large ask_sdk_model tree) stay out of the
+    # cold-start import path
+    from ask_sdk_core.handler_input import HandlerInput
+    from ask_sdk_model import Response
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Logging fora do caminho quente: os handlers só enfileiram o registro
+# (operação de microssegundos) e um QueueListener em thread própria faz
+# a formatação e a escrita no CloudWatch. Lambda congela o processo
+# depois da resposta, mas descongela no próximo invoke e a fila drena —
+# para esta skill, perder o flush imediato vale o ganho no caminho da
+# resposta
+_LOG_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _LOG_QUEUE, logging.StreamHandler(), respect_handler_level=True
+)
+_log_listener.start()
+# Drena a fila e encerra a thread antes de o logging fechar os handlers
+# no shutdown do interpretador
+atexit.register(_log_listener.stop)
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+logger.propagate = False
+
 # Environment variable - configure in Alexa Developer Console
 # Settings > Environment Variables > Add OPENAI_API_KEY
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 
+# Tabela DynamoDB opcional para estado entre sessões (defina
+# PERSISTENCE_TABLE_NAME nas Environment Variables para ativar)
+PERSISTENCE_TABLE = os.environ.get("PERSISTENCE_TABLE_NAME", "")
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+# Modelo principal (respostas detalhadas) e modelo rápido (extrações
+# curtas, onde o menor time-to-first-token importa mais que nuance)
+OPENAI_MODEL = "gpt-5.2-2025-12-11"
+OPENAI_MODEL_FAST = "gpt-4o-mini"
+
+# Máximo de chamadas simultâneas ao OpenAI por invocação — precisa
+# comportar resumos + detalhes especulativos (2 × MAX_PAPERS no pior
+# caso) num único gather, senão a segunda metade espera o semáforo
+MAX_CONCURRENT_LLM_CALLS = 10
+
+# Tentativas por chamada OpenAI: erros transitórios (5xx, 429, conexão)
+# costumam passar num retry de 1-2s, bem antes de virar falha pro usuário
+MAX_LLM_ATTEMPTS = 3
+
+# A Alexa encerra a sessão após ~8s; esperar mais que isso só queima
+# duração de Lambda por uma resposta que o usuário nunca vai ouvir
+OPENAI_TIMEOUT_S = 7.0
+
+# Timeout por tentativa no fan-out assíncrono: logo acima do p50 de uma
+# resposta curta, para que uma tentativa + um retry caibam nos 7s totais
+# (o retry costuma terminar antes do p99 da chamada original)
+ASYNC_ATTEMPT_TIMEOUT_S = 3.5
+
+# ~300 tokens ≈ 200 palavras faladas; 1024 a ~30 tok/s estouraria o
+# orçamento da Alexa com folga
+MAX_COMPLETION_TOKENS = 300
+
+# Corta a geração depois deste número de frases — se o modelo passar das
+# ~200 palavras pedidas no prompt, não vale a pena esperar o resto
+MAX_RESPONSE_SENTENCES = 12
+
+_SENTENCE_END_RE = re.compile(r"[.!?](?:\s|$)")
+
+# Máximo de artigos buscados e guardados em cache por dia
+MAX_PAPERS = 5
+
+# Cache do daily_papers: em memória (processo quente) com fallback em /tmp,
+# que o Lambda preserva entre invocações no mesmo container. O TTL faz um
+# container de vida longa enxergar artigos que o HF adiciona ao longo do dia
+_PAPERS_CACHE = {"date": None, "ts": 0.0, "data": None}
+_PAPERS_TMP_PATH = "/tmp/daily_papers.json"
+_PAPERS_TTL_S = 3600
+
+# Registros completos indexados por id de paper, no escopo do módulo: a
+# sessão da Alexa (serializada em toda resposta) carrega só a lista de
+# ids, e os handlers reidratam daqui; um miss refaz o fetch do dia
+_PAPER_CACHE: dict = {}
+
+# Ordinais usados para numerar os artigos no resumo falado
+ORDINAIS = ["Primeiro", "Segundo", "Terceiro", "Quarto", "Quinto"]
+
+# Os papers do dia são iguais para todos os usuários, então o resumo em
+# português gerado pelo LLM também é: cache por conjunto de títulos,
+# reutilizado entre sessões Alexa no mesmo container quente
+_SUMMARY_CACHE = {}  # chave -> (timestamp, summary, details)
+_DETAILS_CACHE = {}  # título -> (timestamp, texto)
+_LLM_CACHE_TTL_S = 6 * 3600
+
+# Prefixos que indicam resposta de erro/fallback — nunca entram no cache
+_ERROR_PREFIXES = ("Desculpe", "Erro:", "Ainda estou")
+
+
+def _papers_cache_key(papers: list) -> str:
+    """Stable key for a set of papers: sha1 of the sorted titles."""
+    joined = "|".join(sorted(paper["title"] for paper in papers))
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+
+# LRU em memória na frente do DynamoDB: num container quente, restaurar
+# uma sessão não paga nem o GET de ~5-10ms
+_PERSISTED_LRU = collections.OrderedDict()  # userId -> (timestamp, attrs)
+_PERSISTED_LRU_MAX = 128
+
+
+def _persist_session(handler_input, attrs: dict) -> None:
+    """Save session state to the local LRU and, if configured, DynamoDB."""
+    user_id = handler_input.request_envelope.context.system.user.user_id
+
+    _PERSISTED_LRU[user_id] = (time.time(), attrs)
+    _PERSISTED_LRU.move_to_end(user_id)
+    while len(_PERSISTED_LRU) > _PERSISTED_LRU_MAX:
+        _PERSISTED_LRU.popitem(last=False)
+
+    if not PERSISTENCE_TABLE:
+        return
+    try:
+        manager = handler_input.attributes_manager
+        manager.persistent_attributes = attrs
+        manager.save_persistent_attributes()
+    except Exception as e:
+        logger.warning(f"Could not persist session attributes: {e}")
+
+
+def _send_progressive_response(handler_input, speech: str) -> None:
+    """
+    Speak an interim message through Alexa's Progressive Response API.
+    The directive is accepted while the skill is still working, so the
+    user hears something within a second instead of dead air while the
+    LLM calls run — effectively extending the usable response window.
+    """
+    try:
+        system = handler_input.request_envelope.context.system
+        _HTTP.post(
+            f"{system.api_endpoint}/v1/directives",
+            json={
+                "header": {"requestId": handler_input.request_envelope.request.request_id},
+                "directive": {"type": "VoicePlayer.Speak", "speech": speech},
+            },
+            headers={"Authorization": f"Bearer {system.api_access_token}"},
+            timeout=2.0,
+        )
+    except Exception as e:
+        logger.warning(f"Progressive response failed: {e}")
+
+
+def _restore_session(handler_input) -> dict:
+    """Recover persisted state: LRU first, then DynamoDB when configured."""
+    user_id = handler_input.request_envelope.context.system.user.user_id
+
+    cached = _PERSISTED_LRU.get(user_id)
+    if cached and time.time() - cached[0] < _LLM_CACHE_TTL_S:
+        return cached[1]
+
+    if not PERSISTENCE_TABLE:
+        return {}
+    try:
+        attrs = handler_input.attributes_manager.persistent_attributes
+    except Exception as e:
+        logger.warning(f"Could not load persistent attributes: {e}")
+        return {}
+
+    if attrs:
+        _PERSISTED_LRU[user_id] = (time.time(), attrs)
+    return attrs or {}
+
+# Pooled HTTPS connections with keep-alive, reused across warm Lambda
+# invocations (the Python process survives between user turns)
+_HTTP = httpx.Client(
+    timeout=httpx.Timeout(OPENAI_TIMEOUT_S, connect=3.0),
+    limits=httpx.Limits(max_keepalive_connections=8),
+)
+
+
+# Orçamento local de requisições/tokens por minuto, abaixo dos limites
+# da conta OpenAI: esperar alguns ms aqui é mais barato do que pagar um
+# ciclo 429 + retry no caminho visível ao usuário
+OPENAI_RPM_LIMIT = 60
+OPENAI_TPM_LIMIT = 60_000
+
+_LIMITER_LOCK = threading.Lock()
+_REQUEST_LOG = collections.deque()  # pares (timestamp, tokens estimados)
+
+
+def _estimate_tokens(prompt: str) -> int:
+    """Rough token estimate (~4 chars/token) — plenty for throttling."""
+    return len(prompt) // 4 + 1
+
+
+def _throttle_llm_call(prompt: str) -> None:
+    """
+    Local token bucket shared by all OpenAI calls. Blocks until this
+    request fits within the per-minute request and token budget, pruning
+    entries older than 60s on each pass.
+    """
+    tokens = _estimate_tokens(prompt)
+
+    while True:
+        with _LIMITER_LOCK:
+            now = time.monotonic()
+            while _REQUEST_LOG and now - _REQUEST_LOG[0][0] > 60:
+                _REQUEST_LOG.popleft()
+
+            used_tokens = sum(t for _, t in _REQUEST_LOG)
+            if len(_REQUEST_LOG) < OPENAI_RPM_LIMIT and used_tokens + tokens <= OPENAI_TPM_LIMIT:
+                _REQUEST_LOG.append((now, tokens))
+                return
+
+            wait = 60 - (now - _REQUEST_LOG[0][0]) + 0.05
+
+        logger.warning(f"Throttling OpenAI call for {wait:.1f}s to stay under rate limits")
+        time.sleep(wait)
+
+
+def _prewarm_openai() -> None:
+    """
+    Open a pooled HTTPS connection to api.openai.com ahead of time, so the
+    TCP connect and TLS handshake are off the critical path when call_llm
+    runs. The response body is irrelevant; only the live socket matters.
+    """
+    try:
+        _HTTP.head("https://api.openai.com/v1", timeout=3.0)
+    except Exception as e:
+        logger.warning(f"OpenAI prewarm failed: {e}")
+
+
+def _prewarm_connections() -> None:
+    """
+    Cold-start warmup: open pooled HTTPS connections to both upstream
+    hosts. Runs on a daemon thread started at module import, so the TLS
+    handshakes overlap the rest of Lambda's init work instead of landing
+    inside the first invocation.
+    """
+    _prewarm_openai()
+    try:
+        _HTTP.head("https://huggingface.co/api/daily_papers", timeout=3.0)
+    except Exception as e:
+        logger.warning(f"Hugging Face prewarm failed: {e}")
+
+
+# Só dispara fora do ambiente de testes/dev: em cada worker de teste o
+# import do módulo abriria conexões reais (ou esperaria timeouts de DNS)
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    threading.Thread(target=_prewarm_connections, daemon=True).start()
+
 # Mapeamento de números por extenso para dígitos
 NUMERO_MAP = {
     "um": 1, "uma": 1, "primeiro": 1, "primeira": 1,
@@ -42,121 +298,340 @@ NUMERO_MAP = {
     "cinco": 5, "quinto": 5, "quinta": 5,
 }
 
+# Dígito isolado (1-9, com espaços ao redor): casar com regex evita
+# construir um ValueError para cada entrada não numérica
+_DIGIT_RE = re.compile(r"^\s*([1-9])\s*$")
+
 
+@lru_cache(maxsize=64)
 def parse_paper_number(value: str) -> Optional[int]:
-    """Parse paper number from slot value (handles words and digits)."""
+    """
+    Parse paper number from slot value (handles words and digits).
+
+    Slot values come from a tiny vocabulary ("um", "1", "primeiro", ...),
+    so repeat parses within a warm container are served straight from the
+    lru_cache instead of re-running the normalize/lookup/int branches.
+    """
     if not value:
         return None
-    value = value.lower().strip()
-    if value in NUMERO_MAP:
-        return NUMERO_MAP[value]
+    match = _DIGIT_RE.match(value)
+    if match:
+        return int(match.group(1))
+    return NUMERO_MAP.get(value.strip().lower())
+
+
+def _load_papers_from_tmp(today: str) -> Optional[list]:
+    """Load the cached papers from /tmp if from today and still fresh."""
     try:
-        return int(value)
-    except ValueError:
+        with open(_PAPERS_TMP_PATH, "rb") as f:
+            cached = orjson.loads(f.read())
+    except (OSError, ValueError):
         return None
 
+    if cached.get("date") == today and time.time() - cached.get("ts", 0) < _PAPERS_TTL_S:
+        papers = cached.get("papers") or None
+        # Um cache de um deploy antigo (sem o campo id) conta como miss
+        if papers and "id" not in papers[0]:
+            return None
+        return papers
+    return None
+
+
+def _save_papers_to_tmp(today: str, papers: list) -> None:
+    """Persist the papers to /tmp atomically (survives warm containers)."""
+    try:
+        partial = _PAPERS_TMP_PATH + ".part"
+        with open(partial, "wb") as f:
+            f.write(orjson.dumps({"date": today, "ts": time.time(), "papers": papers}))
+        os.replace(partial, _PAPERS_TMP_PATH)
+    except OSError as e:
+        logger.warning(f"Could not persist papers cache: {e}")
+
 
 def fetch_huggingface_papers(limit: int = 5) -> list:
     """
     Fetch latest papers from Hugging Face Hub using their public API.
+
+    The daily_papers endpoint updates roughly once a day, so the decoded
+    list is cached by UTC date: first in a module variable (warm process),
+    then in /tmp (warm container). Only a cold cache hits the network.
     """
     url = "https://huggingface.co/api/daily_papers"
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    if (
+        _PAPERS_CACHE["date"] == today
+        and _PAPERS_CACHE["data"]
+        and time.time() - _PAPERS_CACHE["ts"] < _PAPERS_TTL_S
+    ):
+        return _PAPERS_CACHE["data"][:limit]
+
+    cached = _load_papers_from_tmp(today)
+    if cached:
+        _PAPERS_CACHE["date"] = today
+        _PAPERS_CACHE["ts"] = time.time()
+        _PAPERS_CACHE["data"] = cached
+        _index_papers(cached)
+        return cached[:limit]
 
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "AlexaSkill/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        response = _HTTP.get(
+            url,
+            headers={"User-Agent": "AlexaSkill/1.0"},
+            timeout=httpx.Timeout(5.0, connect=2.0),
+        )
+        data = orjson.loads(response.content)
 
         result = []
-        for paper in data[:limit]:
+        for paper in data[:MAX_PAPERS]:
             paper_info = paper.get("paper", {})
+            # islice para no quinto nome sem materializar a lista
+            # completa (papers de ML costumam ter dezenas de autores)
+            authors = list(islice(
+                (a.get("name", "") for a in paper_info.get("authors") or ()), 5,
+            ))
+            # Normalize once here instead of inside every prompt builder:
+            # collapsed whitespace and capped length mean fewer input
+            # tokens shipped to OpenAI on every single call
+            summary = re.sub(r"\s+", " ", paper_info.get("summary", "")).strip()
             result.append({
+                "id": paper_info.get("id") or paper_info.get("title", ""),
                 "title": paper_info.get("title", "Sem título"),
-                "summary": paper_info.get("summary", ""),
-                "authors": [a.get("name", "") for a in paper_info.get("authors", [])][:5],
+                "summary": summary,
+                "summary_short": summary[:300],
+                "summary_full": summary[:2000],
+                "authors": authors,
+                "authors_str": ", ".join(authors),
             })
 
-        return result
+        _PAPERS_CACHE["date"] = today
+        _PAPERS_CACHE["ts"] = time.time()
+        _PAPERS_CACHE["data"] = result
+        _index_papers(result)
+        _save_papers_to_tmp(today, result)
+
+        return result[:limit]
     except Exception as e:
         logger.error(f"Error fetching papers: {e}")
         return []
 
 
-def call_llm(prompt: str) -> str:
+def call_llm(prompt: str, model: str = OPENAI_MODEL,
+             max_sentences: int = MAX_RESPONSE_SENTENCES,
+             timeout: float = OPENAI_TIMEOUT_S) -> str:
     """
-    Call ChatGPT via direct HTTP request to OpenAI API.
+    Call ChatGPT via a streaming (SSE) HTTP request to the OpenAI API.
+
+    Tokens are accumulated as they arrive; once max_sentences complete
+    sentences are buffered, the stream is closed early so a rambling
+    completion does not hold the response past Alexa's budget.
+
+    Transient failures (timeout, connection reset, 429/5xx) are retried
+    up to MAX_LLM_ATTEMPTS times with exponential backoff; other errors
+    fail fast to the user-facing apology.
     """
     if not OPENAI_API_KEY:
         return "Erro: A chave da API do OpenAI não está configurada. Configure a variável OPENAI_API_KEY nas configurações da skill."
 
-    try:
-        payload = json.dumps({
-            "model": "gpt-5.2-2025-12-11",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_completion_tokens": 1024,
-        }).encode("utf-8")
-
-        req = urllib.request.Request(
-            "https://api.openai.com/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-            },
-        )
+    _throttle_llm_call(prompt)
+
+    for attempt in range(MAX_LLM_ATTEMPTS):
+        if attempt:
+            time.sleep(0.5 * (2 ** (attempt - 1)))
+            logger.info(f"Retrying OpenAI call (attempt {attempt + 1})")
+
+        try:
+            buffer = ""
+            with _HTTP.stream(
+                "POST",
+                OPENAI_CHAT_URL,
+                content=orjson.dumps({
+                    "model": model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "max_completion_tokens": MAX_COMPLETION_TOKENS,
+                    "stream": True,
+                }),
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {OPENAI_API_KEY}",
+                },
+                timeout=timeout,
+            ) as response:
+                if response.status_code == 429 or response.status_code >= 500:
+                    logger.warning(f"Transient OpenAI status {response.status_code}")
+                    continue
+                if response.status_code >= 400:
+                    # Client error (bad key, bad payload): retrying won't help
+                    logger.error(f"OpenAI returned status {response.status_code}")
+                    break
+
+                for line in response.iter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    chunk = line[len("data: "):]
+                    if chunk == "[DONE]":
+                        break
+
+                    choices = orjson.loads(chunk).get("choices") or []
+                    if not choices:
+                        continue
+
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        buffer += content
+                        if len(_SENTENCE_END_RE.findall(buffer)) >= max_sentences:
+                            # Leaving the with-block closes the stream and
+                            # cancels the rest of the generation
+                            break
+
+            if buffer:
+                return buffer
+            logger.warning("OpenAI stream returned no content")
+        except httpx.TimeoutException:
+            # A retry after a full timeout cannot fit Alexa's budget
+            # anyway, so answer immediately with something useful
+            logger.warning(f"OpenAI call timed out after {timeout}s")
+            return "Ainda estou pensando. Me pergunte de novo em alguns segundos."
+        except httpx.TransportError as e:
+            logger.warning(f"Transient OpenAI error: {e}")
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            break
+
+    return "Desculpe, tive um problema ao gerar o resumo."
+
+
+async def _call_llm_async(
+    session: aiohttp.ClientSession,
+    prompt: str,
+    semaphore: asyncio.Semaphore,
+    model: str = OPENAI_MODEL,
+) -> str:
+    """
+    Call ChatGPT for a single prompt over a shared aiohttp session.
+
+    Like the sync path, the completion is streamed (SSE) and the stream
+    is closed as soon as MAX_RESPONSE_SENTENCES complete sentences are
+    buffered, so the slowest call in a gather is bounded by useful
+    output rather than by however long the model keeps talking.
+    """
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_completion_tokens": MAX_COMPLETION_TOKENS,
+        "stream": True,
+    }
+
+    async with semaphore:
+        await asyncio.to_thread(_throttle_llm_call, prompt)
+
+        for attempt in range(2):
+            try:
+                buffer = ""
+                async with session.post(
+                    OPENAI_CHAT_URL,
+                    data=orjson.dumps(payload),
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {OPENAI_API_KEY}",
+                    },
+                    timeout=aiohttp.ClientTimeout(total=ASYNC_ATTEMPT_TIMEOUT_S),
+                ) as response:
+                    if (response.status == 429 or response.status >= 500) and attempt == 0:
+                        logger.warning(f"Transient OpenAI status {response.status}, retrying")
+                        continue
+                    response.raise_for_status()
+
+                    async for raw in response.content:
+                        line = raw.decode("utf-8").strip()
+                        if not line.startswith("data: "):
+                            continue
+                        chunk = line[len("data: "):]
+                        if chunk == "[DONE]":
+                            break
+
+                        choices = orjson.loads(chunk).get("choices") or []
+                        if not choices:
+                            continue
+
+                        content = choices[0].get("delta", {}).get("content")
+                        if content:
+                            buffer += content
+                            if len(_SENTENCE_END_RE.findall(buffer)) >= MAX_RESPONSE_SENTENCES:
+                                break
+
+                if buffer:
+                    return buffer
+                logger.warning("Async OpenAI stream returned no content")
+            except asyncio.TimeoutError:
+                if attempt:
+                    raise
+                logger.warning("Async OpenAI call timed out, retrying once")
+
+        raise RuntimeError("OpenAI stream returned no content")
+
+
+async def _gather_llm_calls(session: aiohttp.ClientSession, jobs: list) -> list:
+    """
+    Run one LLM request per (prompt, model) job concurrently over the
+    caller's session, so every call shares one connection pool.
+    """
+    semaphore = asyncio.Semaphore(min(len(jobs), MAX_CONCURRENT_LLM_CALLS))
 
-        with urllib.request.urlopen(req, timeout=25) as response:
-            result = json.loads(response.read().decode("utf-8"))
+    return await asyncio.gather(
+        *[_call_llm_async(session, prompt, semaphore, model) for prompt, model in jobs],
+        return_exceptions=True,
+    )
 
-        return result["choices"][0]["message"]["content"]
-    except Exception as e:
-        logger.error(f"OpenAI API error: {e}")
-        return "Desculpe, tive um problema ao gerar o resumo."
 
+def _index_papers(papers: list) -> None:
+    """Register full paper records in the warm-container id index."""
+    for paper in papers:
+        _PAPER_CACHE[paper["id"]] = paper
 
-def summarize_papers_with_llm(papers: list) -> str:
+
+def _paper_from_id(paper_id: str) -> Optional[dict]:
     """
-    Use GPT-4o to summarize papers in Brazilian Portuguese.
+    Rehydrate a full paper record from the id stored in the session.
+    A miss means a different container took this turn; today's list is
+    refetched (usually a /tmp or memory hit), which also rebuilds the
+    index. Returns None when the paper left the daily list entirely.
     """
-    if not papers:
-        return "Não encontrei artigos recentes para resumir. Tente novamente mais tarde."
+    paper = _PAPER_CACHE.get(paper_id)
+    if paper:
+        return paper
 
-    papers_text = ""
-    for i, paper in enumerate(papers, 1):
-        authors = ", ".join(paper["authors"])
-        papers_text += f"\nArtigo {i}: {paper['title']}\nAutores: {authors}\nResumo: {paper['summary'][:500]}\n"
+    for paper in fetch_huggingface_papers(MAX_PAPERS):
+        if paper["id"] == paper_id:
+            return paper
+    return None
 
-    prompt = f"""Você é um assistente de voz da Alexa especializado em inteligência artificial.
-Resuma os seguintes artigos científicos do Hugging Face de forma natural e conversacional em Português Brasileiro.
+
+# Templates de prompt pré-montados: o texto fixo (~1 KB de regras) é
+# construído uma única vez no import, e cada chamada só interpola os
+# campos variáveis via format_map
+_PAPER_SUMMARY_TEMPLATE = """Você é um assistente de voz da Alexa especializado em inteligência artificial.
+Resuma o seguinte artigo científico do Hugging Face de forma natural e conversacional em Português Brasileiro.
+
+Título: {title}
+Autores: {authors}
+Resumo: {summary}
 
 REGRAS IMPORTANTES:
 - O resumo será LIDO EM VOZ ALTA pela Alexa
-- Use no máximo 200 palavras no total
+- Use no máximo 2 frases
 - Use linguagem simples e acessível
 - Não use siglas sem explicar
 - Não use formatação como asteriscos ou marcadores
-- NUMERE os artigos (primeiro, segundo, terceiro...) para que o usuário possa pedir detalhes
-- Termine dizendo que o usuário pode pedir mais detalhes sobre qualquer artigo
-
-{papers_text}
-
-Gere um resumo natural e fluido em português brasileiro."""
 
-    return call_llm(prompt)
+Gere um resumo curto e fluido em português brasileiro."""
 
-
-def get_paper_details_with_llm(paper: dict, paper_number: int) -> str:
-    """
-    Use GPT-4o to provide detailed explanation of a specific paper.
-    """
-    authors = ", ".join(paper["authors"])
-
-    prompt = f"""Você é um assistente de voz da Alexa especializado em inteligência artificial.
+_PAPER_DETAILS_TEMPLATE = """Você é um assistente de voz da Alexa especializado em inteligência artificial.
 Explique em detalhes o seguinte artigo científico em Português Brasileiro de forma natural e conversacional.
 
-Título: {paper['title']}
+Título: {title}
 Autores: {authors}
-Resumo completo: {paper['summary']}
+Resumo completo: {summary}
 
 REGRAS IMPORTANTES:
 - O texto será LIDO EM VOZ ALTA pela Alexa
@@ -164,154 +639,531 @@ REGRAS IMPORTANTES:
 - Explique o que o artigo propõe e por que é importante
 - Use linguagem acessível, explicando termos técnicos
 - Não use formatação como asteriscos ou marcadores
-- Comece dizendo "O artigo número {paper_number} de titulo {paper['title']}..." ou similar
+- Comece dizendo "O artigo número {n} de titulo {title}..." ou similar
 
 Gere uma explicação detalhada e natural em português brasileiro."""
 
-    return call_llm(prompt)
+# As regras do lote viajam como system message 100% estática: o mesmo
+# prefixo em toda chamada permite que o provedor aplique prompt caching,
+# e só a lista de artigos (mensagem do usuário) varia por dia
+_BATCH_SYSTEM = """Você é um assistente de voz da Alexa especializado em inteligência artificial.
+Com base nos artigos científicos do Hugging Face enviados pelo usuário, gere um objeto JSON com duas chaves:
+- "resumo": um resumo geral de até 200 palavras, numerando os artigos (primeiro, segundo, terceiro...) e terminando dizendo que o usuário pode pedir mais detalhes sobre qualquer artigo
+- "detalhes": uma lista com exatamente um texto por artigo, na mesma ordem, cada um com até 200 palavras explicando o que o artigo propõe e por que é importante, começando com "O artigo número N de titulo ..."
 
+REGRAS IMPORTANTES:
+- Todos os textos serão LIDOS EM VOZ ALTA pela Alexa
+- Use linguagem simples e acessível, explicando termos técnicos
+- Não use formatação como asteriscos ou marcadores"""
+
+# Saída do lote restrita por JSON Schema (structured outputs): o modelo
+# não consegue devolver chaves erradas ou tipos trocados, então o
+# fallback caro para o fan-out por artigo só dispara em falha de rede
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "papers_bundle",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "resumo": {"type": "string"},
+                "detalhes": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["resumo", "detalhes"],
+            "additionalProperties": False,
+        },
+    },
+}
 
-class LaunchRequestHandler(AbstractRequestHandler):
-    """Handler for Skill Launch."""
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return ask_utils.is_request_type("LaunchRequest")(handler_input)
+def _build_paper_summary_prompt(paper: dict) -> str:
+    """Build the short per-paper summary prompt."""
+    return _PAPER_SUMMARY_TEMPLATE.format_map({
+        "title": paper["title"],
+        "authors": paper["authors_str"],
+        "summary": paper["summary_short"],
+    })
 
-    def handle(self, handler_input: HandlerInput) -> Response:
-        speak_output = (
-            "Olá! Sou sua assistente de artigos do Hugging Face. "
-            "Diga resumir artigos para ouvir as novidades em inteligência artificial."
-        )
 
-        return (
-            handler_input.response_builder
-                .speak(speak_output)
-                .ask("Diga resumir artigos para começar.")
-                .response
+async def _summarize_and_prefetch_async(
+    session: aiohttp.ClientSession, papers: list,
+) -> tuple:
+    """
+    Summarize papers in Brazilian Portuguese using one short ChatGPT
+    request per paper, fired concurrently — and, in the same gather,
+    speculatively request the detailed explanation of every paper. The
+    user's likely follow-up ("detalhes do artigo dois") is then already
+    cached, instead of costing a fresh 2-5s LLM round-trip.
+
+    Returns (summary, details, complete) where details[i] is None on
+    failure and complete is True only when every call succeeded.
+    """
+    # Short two-sentence summaries go to the fast model; the detailed
+    # explanations keep the main model for nuance
+    jobs = [(_build_paper_summary_prompt(paper), OPENAI_MODEL_FAST) for paper in papers]
+    jobs += [(_build_paper_details_prompt(paper, i), OPENAI_MODEL) for i, paper in enumerate(papers, 1)]
+    results = await _gather_llm_calls(session, jobs)
+
+    parts = []
+    for i, result in enumerate(results[:len(papers)], 1):
+        if isinstance(result, Exception):
+            logger.error(f"Error summarizing paper {i}: {result}")
+            continue
+        # ORDINAIS cobre só os 5 primeiros; lotes maiores (rodada
+        # hierárquica) caem no rótulo numérico
+        if i <= len(ORDINAIS):
+            label = f"{ORDINAIS[i - 1]} artigo"
+        else:
+            label = f"Artigo {i}"
+        parts.append(f"{label}: {result.strip()}")
+
+    details = [
+        None if isinstance(result, Exception) else result.strip()
+        for result in results[len(papers):]
+    ]
+
+    complete = len(parts) == len(papers) and all(
+        detail is not None for detail in details
+    )
+
+    if not parts:
+        return ("Desculpe, tive um problema ao gerar o resumo.", details, False)
+
+    summary = (
+        "Aqui estão os artigos mais recentes do Hugging Face. "
+        + " ".join(parts)
+        + " Você pode pedir mais detalhes sobre qualquer artigo. "
+        "Por exemplo, diga: detalhes do artigo um."
+    )
+    return (summary, details, complete)
+
+
+# A partir deste tamanho de lote, os abstracts passam antes por uma
+# rodada paralela de condensação (uma frase por artigo), mantendo o
+# prompt final com tamanho praticamente constante conforme o dia rende
+# mais papers. Hoje MAX_PAPERS fica abaixo disso, então o desvio só
+# liga se os limites crescerem
+_HIERARCHICAL_THRESHOLD = 6
+
+_MICRO_SUMMARY_TEMPLATE = (
+    "Resuma o artigo científico abaixo em uma única frase em Português Brasileiro, "
+    "sem formatação.\n\nTítulo: {title}\nResumo: {summary}"
+)
+
+
+async def _condense_papers_async(
+    session: aiohttp.ClientSession, papers: list,
+) -> list:
+    """
+    Map step of a hierarchical (map-reduce) summary for large batches:
+    condense every abstract to one sentence with the fast model, all in
+    parallel, before the normal summary call stitches them together.
+    A paper whose condensation fails keeps a harder-truncated abstract.
+    """
+    jobs = [
+        (
+            _MICRO_SUMMARY_TEMPLATE.format_map({
+                "title": paper["title"],
+                "summary": paper["summary_short"],
+            }),
+            OPENAI_MODEL_FAST,
         )
+        for paper in papers
+    ]
+    results = await _gather_llm_calls(session, jobs)
+
+    condensed = []
+    for paper, result in zip(papers, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Could not condense paper '{paper['title']}': {result}")
+            micro = paper["summary_short"][:150]
+        else:
+            micro = result.strip()
+        condensed.append(dict(paper, summary_short=micro))
+    return condensed
+
+
+async def _batch_summary_and_details_async(
+    session: aiohttp.ClientSession, papers: list,
+) -> dict:
+    """
+    Produce the spoken summary AND a per-paper detailed explanation in a
+    single chat completion with a JSON response. The input tokens are paid
+    once and one rate-limit slot is consumed instead of one per view; the
+    details land in the session cache so follow-up intents cost nothing.
 
+    Returns {"summary": str, "details": [str, ...]} or {} on failure
+    (callers fall back to the per-paper path).
+    """
+    if not papers:
+        return {}
 
-class GetPapersSummaryIntentHandler(AbstractRequestHandler):
-    """Handler for Get Papers Summary Intent."""
+    papers_text = "".join(
+        f"\nArtigo {i}: {paper['title']}\nAutores: {paper['authors_str']}\nResumo: {paper['summary_short']}\n"
+        for i, paper in enumerate(papers, 1)
+    )
+    user_content = f"São {len(papers)} artigos:\n{papers_text}"
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return ask_utils.is_intent_name("GetPapersSummaryIntent")(handler_input)
+    await asyncio.to_thread(_throttle_llm_call, _BATCH_SYSTEM + user_content)
 
-    def handle(self, handler_input: HandlerInput) -> Response:
-        logger.info("Fetching and summarizing Hugging Face papers")
+    try:
+        async with session.post(
+            OPENAI_CHAT_URL,
+            data=orjson.dumps({
+                # O lote inteiro roda no modelo rápido: resumo de 150
+                # palavras e explicações de 200 palavras estão bem dentro
+                # da capacidade dele, e essa chamada é o caminho crítico
+                # dos 8 segundos da Alexa
+                "model": OPENAI_MODEL_FAST,
+                "messages": [
+                    {"role": "system", "content": _BATCH_SYSTEM},
+                    {"role": "user", "content": user_content},
+                ],
+                "max_completion_tokens": 2048,
+                "response_format": _BATCH_RESPONSE_FORMAT,
+            }),
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {OPENAI_API_KEY}",
+            },
+        ) as response:
+            result = orjson.loads(await response.read())
+
+        parsed = orjson.loads(result["choices"][0]["message"]["content"])
+
+        summary = parsed.get("resumo")
+        details = parsed.get("detalhes")
+
+        if not isinstance(summary, str) or not isinstance(details, list):
+            logger.warning("Batched LLM response missing expected keys")
+            return {}
+        if len(details) != len(papers):
+            logger.warning("Batched LLM response has wrong number of details")
+            return {}
 
-        papers = fetch_huggingface_papers(limit=4)
+        return {"summary": summary, "details": [str(d) for d in details]}
+    except Exception as e:
+        logger.error(f"Batched OpenAI call failed: {e}")
+        return {}
+
+
+async def _summary_turn(limit: int) -> tuple:
+    """
+    The whole summary turn on a single event loop and aiohttp session:
+    fetch the papers (usually a cache hit) while prewarming the OpenAI
+    connection, try the batched summary+details call, and fall back to
+    the per-paper fan-out if its JSON comes back malformed.
+
+    Returns (papers, summary, details); papers is empty when the Hugging
+    Face fetch failed.
+    """
+    timeout = aiohttp.ClientTimeout(total=OPENAI_TIMEOUT_S)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        # The fetch stays on the pooled sync client (it is cache-dominated
+        # and reuses a warm socket); overlapping it with the prewarm keeps
+        # the TLS handshake off the critical path on cold pools
+        papers, _ = await asyncio.gather(
+            asyncio.to_thread(fetch_huggingface_papers, limit),
+            asyncio.to_thread(_prewarm_openai),
+        )
 
         if not papers:
-            speak_output = (
-                "Desculpe, não consegui buscar os artigos no momento. "
-                "Por favor, tente novamente mais tarde."
-            )
+            return [], "", []
+
+        if not OPENAI_API_KEY:
             return (
-                handler_input.response_builder
-                    .speak(speak_output)
-                    .response
+                papers,
+                "Erro: A chave da API do OpenAI não está configurada. Configure a variável OPENAI_API_KEY nas configurações da skill.",
+                [],
             )
 
-        # Store papers in session for later reference
-        session_attr = handler_input.attributes_manager.session_attributes
-        session_attr["papers"] = papers
+        # Same papers -> same Portuguese summary: serve repeat daily
+        # callers from the container-wide cache, skipping the LLM entirely
+        key = _papers_cache_key(papers)
+        cached = _SUMMARY_CACHE.get(key)
+        if cached and time.time() - cached[0] < _LLM_CACHE_TTL_S:
+            return papers, cached[1], cached[2]
+
+        prompt_papers = papers
+        if len(papers) >= _HIERARCHICAL_THRESHOLD:
+            prompt_papers = await _condense_papers_async(session, papers)
+
+        bundle = await _batch_summary_and_details_async(session, prompt_papers)
+        if bundle:
+            _SUMMARY_CACHE[key] = (time.time(), bundle["summary"], bundle["details"])
+            return papers, bundle["summary"], bundle["details"]
+
+        summary, details, complete = await _summarize_and_prefetch_async(
+            session, prompt_papers,
+        )
+        # Resultados parciais são servidos mas não cacheados: um resumo
+        # sem alguns artigos pinado pelo TTL afetaria todo o container
+        if complete:
+            _SUMMARY_CACHE[key] = (time.time(), summary, details)
+        return papers, summary, details
+
+
+def run_summary_turn(limit: int) -> tuple:
+    """Drive the async summary pipeline from a synchronous handler."""
+    return asyncio.run(_summary_turn(limit))
+
+
+def _build_paper_details_prompt(paper: dict, paper_number: int) -> str:
+    """Build the detailed-explanation prompt for a single paper."""
+    return _PAPER_DETAILS_TEMPLATE.format_map({
+        "title": paper["title"],
+        "authors": paper["authors_str"],
+        "summary": paper["summary_full"],
+        "n": paper_number,
+    })
+
+
+def get_paper_details_with_llm(paper: dict, paper_number: int) -> str:
+    """
+    Use GPT-4o to provide detailed explanation of a specific paper.
+    The generated text is cached by title across sessions in the same
+    warm container, since the explanation does not depend on the user.
+    """
+    cached = _DETAILS_CACHE.get(paper["title"])
+    if cached and time.time() - cached[0] < _LLM_CACHE_TTL_S:
+        return cached[1]
+
+    text = call_llm(_build_paper_details_prompt(paper, paper_number))
+    if not text.startswith(_ERROR_PREFIXES):
+        _DETAILS_CACHE[paper["title"]] = (time.time(), text)
+    return text
+
+
+# Falas estáticas dos handlers, montadas (e internadas) uma única vez no
+# import; os handle() quentes só referenciam as constantes
+LAUNCH_SPEAK = (
+    "Olá! Sou sua assistente de artigos do Hugging Face. "
+    "Diga resumir artigos para ouvir as novidades em inteligência artificial."
+)
+START_REPROMPT = "Diga resumir artigos para começar."
+SUMMARY_REPROMPT = "Quer mais detalhes sobre algum artigo? Diga o número."
+NO_PAPERS_SPEAK = (
+    "Ainda não busquei os artigos. "
+    "Diga resumir artigos primeiro, e depois peça detalhes."
+)
+INVALID_NUMBER_REPROMPT = "Qual artigo você quer saber mais?"
+PAPER_GONE_SPEAK = (
+    "Desculpe, não encontrei mais esse artigo. "
+    "Diga resumir artigos para atualizar a lista."
+)
+DETAILS_REPROMPT = "Quer saber sobre outro artigo?"
+HELP_SPEAK = (
+    "Eu resumo os artigos mais recentes de inteligência artificial do Hugging Face. "
+    "Diga resumir artigos para ouvir as novidades. "
+    "Depois, você pode pedir detalhes sobre um artigo específico dizendo, "
+    "por exemplo, detalhes do artigo dois."
+)
+STOP_SPEAK = "Até mais!"
+FALLBACK_SPEAK = "Não entendi. Diga resumir artigos ou quais são as novidades."
+ERROR_SPEAK = "Desculpe, ocorreu um erro. Tente novamente."
+ERROR_REPROMPT = "Tente novamente."
+
+
+class LaunchRequestHandler(AbstractRequestHandler):
+    """Handler for Skill Launch."""
 
-        speak_output = summarize_papers_with_llm(papers)
+    # Predicados compilados uma vez por classe: o SDK percorre a cadeia
+    # inteira de handlers a cada requisição, e recriar a closure em todo
+    # can_handle só gera alocação repetida
+    _PREDICATE = staticmethod(ask_utils.is_request_type("LaunchRequest"))
 
+    def can_handle(self, handler_input: HandlerInput) -> bool:
+        return self._PREDICATE(handler_input)
+
+    def handle(self, handler_input: HandlerInput) -> Response:
         return (
             handler_input.response_builder
-                .speak(speak_output)
-                .ask("Quer mais detalhes sobre algum artigo? Diga o número.")
+                .speak(LAUNCH_SPEAK)
+                .ask(START_REPROMPT)
                 .response
         )
 
 
-class GetLatestNewsIntentHandler(AbstractRequestHandler):
-    """Handler for getting latest AI news/papers."""
+class _BasePapersSummaryHandler(AbstractRequestHandler):
+    """
+    Shared fetch + summarize + session-cache flow for the summary intents.
+    Subclasses only declare the intent name, fetch limit and messages.
+    """
+
+    intent_name: str = ""
+    limit: int = 4
+    log_message: str = ""
+    fetch_error_speak: str = ""
+    progress_speak: str = "Um momento, estou buscando os artigos mais recentes."
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Compila o predicado uma vez por subclasse concreta
+        if cls.intent_name:
+            cls._PREDICATE = staticmethod(ask_utils.is_intent_name(cls.intent_name))
 
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        return ask_utils.is_intent_name("GetLatestNewsIntent")(handler_input)
+        return self._PREDICATE(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        logger.info("Fetching latest AI news from Hugging Face")
+        logger.info(self.log_message)
+
+        # Fire-and-forget so the interim speech never delays the real work
+        threading.Thread(
+            target=_send_progressive_response,
+            args=(handler_input, self.progress_speak),
+            daemon=True,
+        ).start()
 
-        papers = fetch_huggingface_papers(limit=3)
+        papers, speak_output, details = run_summary_turn(self.limit)
 
         if not papers:
-            speak_output = "Desculpe, não consegui buscar as novidades. Tente novamente."
             return (
                 handler_input.response_builder
-                    .speak(speak_output)
+                    .speak(self.fetch_error_speak)
                     .response
             )
 
-        # Store papers in session for later reference
+        # Only the paper ids travel in the session JSON (serialized into
+        # every response); full records stay in the module-level index
         session_attr = handler_input.attributes_manager.session_attributes
-        session_attr["papers"] = papers
+        session_attr["papers"] = [paper["id"] for paper in papers]
+        if details and any(details):
+            session_attr["details"] = details
 
-        speak_output = summarize_papers_with_llm(papers)
+        # Keep the expensive LLM results across session end / cold start
+        _persist_session(handler_input, {
+            "papers": session_attr["papers"],
+            "details": session_attr.get("details", []),
+        })
 
         return (
             handler_input.response_builder
                 .speak(speak_output)
-                .ask("Quer mais detalhes sobre algum artigo? Diga o número.")
+                .ask(SUMMARY_REPROMPT)
                 .response
         )
 
 
-class GetPaperDetailsIntentHandler(AbstractRequestHandler):
-    """Handler for getting details about a specific paper."""
+class GetPapersSummaryIntentHandler(_BasePapersSummaryHandler):
+    """Handler for Get Papers Summary Intent."""
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return ask_utils.is_intent_name("GetPaperDetailsIntent")(handler_input)
+    intent_name = "GetPapersSummaryIntent"
+    limit = 4
+    log_message = "Fetching and summarizing Hugging Face papers"
+    fetch_error_speak = (
+        "Desculpe, não consegui buscar os artigos no momento. "
+        "Por favor, tente novamente mais tarde."
+    )
 
-    def handle(self, handler_input: HandlerInput) -> Response:
-        logger.info("Getting paper details")
 
-        # Get paper number from slot
-        slots = handler_input.request_envelope.request.intent.slots
-        paper_number = None
+class GetLatestNewsIntentHandler(_BasePapersSummaryHandler):
+    """Handler for getting latest AI news/papers."""
+
+    intent_name = "GetLatestNewsIntent"
+    limit = 3
+    log_message = "Fetching latest AI news from Hugging Face"
+    fetch_error_speak = "Desculpe, não consegui buscar as novidades. Tente novamente."
+
 
-        if slots and "paperNumber" in slots and slots["paperNumber"].value:
-            paper_number = parse_paper_number(slots["paperNumber"].value)
+class _PaperByNumberHandler(AbstractRequestHandler):
+    """
+    Base for intents that act on one paper chosen by its number. Bundles
+    the slot parse, session check and range validation so each concrete
+    handler's handle() only deals with its own view of the paper.
+    """
 
-        # Get papers from session
+    slot_name = "paperNumber"
+
+    def _get_number(self, handler_input: HandlerInput) -> Optional[int]:
+        """Parse the paper number from the slot, if present."""
+        slots = handler_input.request_envelope.request.intent.slots
+        if slots and self.slot_name in slots and slots[self.slot_name].value:
+            return parse_paper_number(slots[self.slot_name].value)
+        return None
+
+    def _resolve_paper(self, handler_input: HandlerInput):
+        """
+        Validate session and slot. Returns (paper_number, papers, None) on
+        success or (None, None, error_response) when the user needs to be
+        re-prompted.
+        """
         session_attr = handler_input.attributes_manager.session_attributes
         papers = session_attr.get("papers", [])
 
         if not papers:
-            speak_output = (
-                "Ainda não busquei os artigos. "
-                "Diga resumir artigos primeiro, e depois peça detalhes."
-            )
-            return (
+            # A fresh session can still reuse the last summary turn's
+            # papers and prefetched details from the persistence layer
+            restored = _restore_session(handler_input)
+            papers = restored.get("papers", [])
+            if papers:
+                session_attr["papers"] = papers
+                if restored.get("details"):
+                    session_attr["details"] = restored["details"]
+
+        if not papers:
+            error_response = (
                 handler_input.response_builder
-                    .speak(speak_output)
-                    .ask("Diga resumir artigos para começar.")
+                    .speak(NO_PAPERS_SPEAK)
+                    .ask(START_REPROMPT)
                     .response
             )
+            return None, None, error_response
 
+        paper_number = self._get_number(handler_input)
         if not paper_number or paper_number < 1 or paper_number > len(papers):
-            speak_output = (
-                f"Por favor, diga um número de 1 a {len(papers)}. "
-                f"Por exemplo, diga: detalhes do artigo 1."
-            )
-            return (
+            error_response = (
                 handler_input.response_builder
-                    .speak(speak_output)
-                    .ask("Qual artigo você quer saber mais?")
+                    .speak(
+                        f"Por favor, diga um número de 1 a {len(papers)}. "
+                        f"Por exemplo, diga: detalhes do artigo 1."
+                    )
+                    .ask(INVALID_NUMBER_REPROMPT)
                     .response
             )
+            return None, None, error_response
+
+        return paper_number, papers, None
+
+
+class GetPaperDetailsIntentHandler(_PaperByNumberHandler):
+    """Handler for getting details about a specific paper."""
+
+    _PREDICATE = staticmethod(ask_utils.is_intent_name("GetPaperDetailsIntent"))
 
-        # Get the specific paper
-        paper = papers[paper_number - 1]
-        speak_output = get_paper_details_with_llm(paper, paper_number)
+    def can_handle(self, handler_input: HandlerInput) -> bool:
+        return self._PREDICATE(handler_input)
+
+    def handle(self, handler_input: HandlerInput) -> Response:
+        logger.info("Getting paper details")
+
+        paper_number, papers, error_response = self._resolve_paper(handler_input)
+        if error_response:
+            return error_response
+
+        # Serve the explanation from the session cache when the batched
+        # summary call already produced it; only call the LLM on a miss
+        session_attr = handler_input.attributes_manager.session_attributes
+        details = session_attr.get("details") or []
+        if paper_number <= len(details) and details[paper_number - 1]:
+            speak_output = details[paper_number - 1]
+        else:
+            paper = _paper_from_id(papers[paper_number - 1])
+            if paper is None:
+                return (
+                    handler_input.response_builder
+                        .speak(PAPER_GONE_SPEAK)
+                        .ask(START_REPROMPT)
+                        .response
+                )
+            speak_output = get_paper_details_with_llm(paper, paper_number)
 
         return (
             handler_input.response_builder
                 .speak(speak_output)
-                .ask("Quer saber sobre outro artigo?")
+                .ask(DETAILS_REPROMPT)
                 .response
         )
 
@@ -319,21 +1171,16 @@ class GetPaperDetailsIntentHandler(AbstractRequestHandler):
 class HelpIntentHandler(AbstractRequestHandler):
     """Handler for Help Intent."""
 
+    _PREDICATE = staticmethod(ask_utils.is_intent_name("AMAZON.HelpIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        return ask_utils.is_intent_name("AMAZON.HelpIntent")(handler_input)
+        return self._PREDICATE(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        speak_output = (
-            "Eu resumo os artigos mais recentes de inteligência artificial do Hugging Face. "
-            "Diga resumir artigos para ouvir as novidades. "
-            "Depois, você pode pedir detalhes sobre um artigo específico dizendo, "
-            "por exemplo, detalhes do artigo dois."
-        )
-
         return (
             handler_input.response_builder
-                .speak(speak_output)
-                .ask(speak_output)
+                .speak(HELP_SPEAK)
+                .ask(HELP_SPEAK)
                 .response
         )
 
@@ -341,16 +1188,18 @@ class HelpIntentHandler(AbstractRequestHandler):
 class CancelOrStopIntentHandler(AbstractRequestHandler):
     """Handler for Cancel and Stop Intent."""
 
+    _PREDICATES = (
+        ask_utils.is_intent_name("AMAZON.CancelIntent"),
+        ask_utils.is_intent_name("AMAZON.StopIntent"),
+    )
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        return (
-            ask_utils.is_intent_name("AMAZON.CancelIntent")(handler_input) or
-            ask_utils.is_intent_name("AMAZON.StopIntent")(handler_input)
-        )
+        return any(predicate(handler_input) for predicate in self._PREDICATES)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         return (
             handler_input.response_builder
-                .speak("Até mais!")
+                .speak(STOP_SPEAK)
                 .response
         )
 
@@ -358,16 +1207,16 @@ class CancelOrStopIntentHandler(AbstractRequestHandler):
 class FallbackIntentHandler(AbstractRequestHandler):
     """Handler for Fallback Intent."""
 
+    _PREDICATE = staticmethod(ask_utils.is_intent_name("AMAZON.FallbackIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        return ask_utils.is_intent_name("AMAZON.FallbackIntent")(handler_input)
+        return self._PREDICATE(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        speak_output = "Não entendi. Diga resumir artigos ou quais são as novidades."
-
         return (
             handler_input.response_builder
-                .speak(speak_output)
-                .ask(speak_output)
+                .speak(FALLBACK_SPEAK)
+                .ask(FALLBACK_SPEAK)
                 .response
         )
 
@@ -375,8 +1224,10 @@ class FallbackIntentHandler(AbstractRequestHandler):
 class SessionEndedRequestHandler(AbstractRequestHandler):
     """Handler for Session End."""
 
+    _PREDICATE = staticmethod(ask_utils.is_request_type("SessionEndedRequest"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        return ask_utils.is_request_type("SessionEndedRequest")(handler_input)
+        return self._PREDICATE(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         return handler_input.response_builder.response
@@ -393,23 +1244,42 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
 
         return (
             handler_input.response_builder
-                .speak("Desculpe, ocorreu um erro. Tente novamente.")
-                .ask("Tente novamente.")
+                .speak(ERROR_SPEAK)
+                .ask(ERROR_REPROMPT)
                 .response
         )
 
 
-# Skill Builder
-sb = SkillBuilder()
+def _build_skill():
+    """
+    Build the skill and return its Lambda handler. SkillBuilder is
+    imported here rather than at module top so the heavy serializer
+    machinery loads only once the handler chain is actually assembled.
+    """
+    if PERSISTENCE_TABLE:
+        from ask_sdk_core.skill_builder import CustomSkillBuilder
+        from ask_sdk_dynamodb.adapter import DynamoDbAdapter
+
+        sb = CustomSkillBuilder(persistence_adapter=DynamoDbAdapter(
+            table_name=PERSISTENCE_TABLE,
+            create_table=True,
+        ))
+    else:
+        from ask_sdk_core.skill_builder import SkillBuilder
+
+        sb = SkillBuilder()
+
+    sb.add_request_handler(LaunchRequestHandler())
+    sb.add_request_handler(GetPapersSummaryIntentHandler())
+    sb.add_request_handler(GetLatestNewsIntentHandler())
+    sb.add_request_handler(GetPaperDetailsIntentHandler())
+    sb.add_request_handler(HelpIntentHandler())
+    sb.add_request_handler(CancelOrStopIntentHandler())
+    sb.add_request_handler(FallbackIntentHandler())
+    sb.add_request_handler(SessionEndedRequestHandler())
+    sb.add_exception_handler(CatchAllExceptionHandler())
+
+    return sb.lambda_handler()
 
-sb.add_request_handler(LaunchRequestHandler())
-sb.add_request_handler(GetPapersSummaryIntentHandler())
-sb.add_request_handler(GetLatestNewsIntentHandler())
-sb.add_request_handler(GetPaperDetailsIntentHandler())
-sb.add_request_handler(HelpIntentHandler())
-sb.add_request_handler(CancelOrStopIntentHandler())
-sb.add_request_handler(FallbackIntentHandler())
-sb.add_request_handler(SessionEndedRequestHandler())
-sb.add_exception_handler(CatchAllExceptionHandler())
 
-lambda_handler = sb.lambda_handler()
+lambda_handler = _build_skill()
@@ -0,0 +1,15 @@
+import os
+import sys
+
+# O código da skill vive em lambda/ sem ser um pacote instalável; os
+# testes importam lambda_function direto do diretório
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "lambda"))
+
+# Cada worker do xdist importa lambda_function do zero; garanta que o
+# import fique barato e offline: sem tabela de persistência não há
+# import adiado de boto3/DynamoDB, e fora do Lambda (sem
+# AWS_LAMBDA_FUNCTION_NAME) a thread de prewarm de conexões nem nasce.
+# ask_sdk_core/ask_sdk_model NÃO são stubados: os testes de can_handle
+# dependem das classes reais de request
+os.environ.pop("PERSISTENCE_TABLE_NAME", None)
+os.environ.pop("AWS_LAMBDA_FUNCTION_NAME", None)
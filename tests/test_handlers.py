@@ -0,0 +1,457 @@
+"""
+Testes unitários dos handlers da skill.
+
+Todo I/O (Hugging Face, OpenAI, DynamoDB) é substituído por mocks; cada
+teste monta um handler_input falso e verifica a fala gerada. Funções
+pytest puras (sem unittest.TestCase): o pytest-xdist escalona no nível
+da função, então `pytest -n auto` balanceia a carga teste a teste.
+"""
+
+import types
+from dataclasses import dataclass, field
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from ask_sdk_model import Intent, IntentRequest, LaunchRequest, SessionEndedRequest
+
+import lambda_function
+
+from lambda_function import (
+    CancelOrStopIntentHandler,
+    CatchAllExceptionHandler,
+    FallbackIntentHandler,
+    GetLatestNewsIntentHandler,
+    GetPaperDetailsIntentHandler,
+    GetPapersSummaryIntentHandler,
+    HelpIntentHandler,
+    LaunchRequestHandler,
+    SessionEndedRequestHandler,
+)
+
+# Fixture congelada: tupla de mapeamentos somente leitura. Nenhum teste
+# (nem os workers paralelos do xdist) consegue mutá-la por acidente, e o
+# compartilhamento é sempre por referência
+_RAW_PAPERS = [
+    {
+        "id": "2401.00001",
+        "title": "Atenção Eficiente",
+        "summary": "Um mecanismo de atenção linear.",
+        "summary_short": "Um mecanismo de atenção linear.",
+        "summary_full": "Um mecanismo de atenção linear.",
+        "authors": ["Ana Silva"],
+        "authors_str": "Ana Silva",
+    },
+    {
+        "id": "2401.00002",
+        "title": "Modelos Pequenos",
+        "summary": "Destilação de modelos grandes.",
+        "summary_short": "Destilação de modelos grandes.",
+        "summary_full": "Destilação de modelos grandes.",
+        "authors": ["Bruno Costa"],
+        "authors_str": "Bruno Costa",
+    },
+    {
+        "id": "2401.00003",
+        "title": "Difusão Rápida",
+        "summary": "Geração de imagens em poucos passos.",
+        "summary_short": "Geração de imagens em poucos passos.",
+        "summary_full": "Geração de imagens em poucos passos.",
+        "authors": ["Carla Dias"],
+        "authors_str": "Carla Dias",
+    },
+]
+
+SAMPLE_PAPERS = tuple(types.MappingProxyType(paper) for paper in _RAW_PAPERS)
+
+# Os handlers guardam listas na sessão, então os espelhos continuam listas
+SAMPLE_IDS = [paper["id"] for paper in SAMPLE_PAPERS]
+
+SAMPLE_DETAILS = [
+    "O artigo número 1 fala de atenção.",
+    "O artigo número 2 fala de destilação.",
+    "O artigo número 3 fala de difusão.",
+]
+
+SAMPLE_SUMMARY = "Aqui estão os artigos de hoje."
+
+_N_SAMPLE_PAPERS = len(SAMPLE_PAPERS)
+_N_SAMPLE_PAPERS_STR = str(_N_SAMPLE_PAPERS)
+
+
+def _slot(value):
+    """Build a fake slot carrying the given raw value."""
+    slot = MagicMock()
+    slot.value = value
+    return slot
+
+
+# Slots pré-construídos uma vez por worker (os handlers só leem .value,
+# então compartilhar a mesma instância entre testes é seguro); os testes
+# referenciam _SLOTS[valor] em vez de montar um MagicMock cada um
+_SLOTS = {
+    value: _slot(value)
+    for value in ("1", "2", "0", "-1", "99", "banana", "", None, "primeiro", "terceiro")
+}
+
+
+@dataclass
+class ResponseSpy:
+    """
+    Response builder de mentira com atributos simples. Cada asserção dos
+    testes virava três operações internas de MagicMock (assert_called_once,
+    call_args, indexação); aqui é só ler .spoken / .asked.
+    """
+
+    spoken: list = field(default_factory=list)
+    asked: int = 0
+    # Os handlers testam a verdade da response devolvida (ex.:
+    # `if error_response: return error_response`), então não pode ser None
+    response = object()
+
+    def speak(self, speech):
+        self.spoken.append(speech)
+        return self
+
+    def ask(self, reprompt=None):
+        self.asked += 1
+        return self
+
+    def set_should_end_session(self, *args, **kwargs):
+        return self
+
+    def reset(self):
+        self.spoken.clear()
+        self.asked = 0
+
+
+def _make_handler_input(slots=None, session_attrs=None):
+    """
+    Build a fake HandlerInput. Everything the handlers only read is a
+    plain SimpleNamespace — MagicMock auto-creates a child mock per
+    attribute access and is far slower to construct — and the
+    response_builder is a ResponseSpy, asserted via plain attributes.
+    """
+    return types.SimpleNamespace(
+        request_envelope=types.SimpleNamespace(
+            request=types.SimpleNamespace(intent=types.SimpleNamespace(slots=slots)),
+        ),
+        attributes_manager=types.SimpleNamespace(
+            session_attributes={} if session_attrs is None else session_attrs,
+        ),
+        response_builder=ResponseSpy(),
+    )
+
+
+# Construir a árvore de fakes é a parte mais cara destes testes; os
+# testes reutilizam um handler_input base e só zeram o ResponseSpy e
+# trocam slots/sessão por teste
+_BASE_HI = _make_handler_input()
+
+
+def _clone_hi(slots=None, session_attrs=None):
+    """Reset and re-dress the shared base handler_input for one test."""
+    handler_input = _BASE_HI
+    handler_input.response_builder.reset()
+    handler_input.request_envelope.request.intent.slots = slots
+    handler_input.attributes_manager.session_attributes = (
+        {} if session_attrs is None else session_attrs
+    )
+    return handler_input
+
+
+def _last_speech(handler_input):
+    """Last string passed to response_builder.speak."""
+    return handler_input.response_builder.spoken[-1]
+
+
+def _intent_input(name):
+    """Fake HandlerInput carrying a real IntentRequest (for can_handle)."""
+    return types.SimpleNamespace(
+        request_envelope=types.SimpleNamespace(
+            request=IntentRequest(intent=Intent(name=name)),
+        ),
+    )
+
+
+def _request_input(request_cls):
+    """Fake HandlerInput carrying a real non-intent request."""
+    return types.SimpleNamespace(
+        request_envelope=types.SimpleNamespace(request=request_cls()),
+    )
+
+
+# O can_handle do exception handler ignora os dois argumentos; nada
+# justifica construir um mock e uma exceção novos por teste
+_HI_SENTINEL = object()
+_ERR = RuntimeError("boom")
+
+
+# ---------------------------------------------------------------------------
+# LaunchRequestHandler
+
+
+def test_launch_can_handle_launch_request():
+    assert LaunchRequestHandler().can_handle(_request_input(LaunchRequest))
+
+
+def test_launch_can_handle_rejeita_intent():
+    assert not LaunchRequestHandler().can_handle(_intent_input("GetPapersSummaryIntent"))
+
+
+def test_launch_handle_fala_boas_vindas():
+    handler_input = _make_handler_input()
+    LaunchRequestHandler().handle(handler_input)
+    assert len(handler_input.response_builder.spoken) == 1
+    assert "Hugging Face" in _last_speech(handler_input)
+    assert handler_input.response_builder.asked == 1
+
+
+# ---------------------------------------------------------------------------
+# Intents de resumo (diferem só em classe, intent e limite)
+
+_SUMMARY_CASES = [
+    pytest.param(
+        GetPapersSummaryIntentHandler, "GetPapersSummaryIntent", "GetLatestNewsIntent", 4,
+        id="papers",
+    ),
+    pytest.param(
+        GetLatestNewsIntentHandler, "GetLatestNewsIntent", "GetPapersSummaryIntent", 3,
+        id="news",
+    ),
+]
+
+_summary_params = pytest.mark.parametrize(
+    "handler_cls, intent, other_intent, limit", _SUMMARY_CASES,
+)
+
+
+@pytest.fixture(scope="module")
+def _summary_patchers():
+    """Patch the summary-turn collaborators once for the whole module."""
+    patchers = (
+        patch.object(lambda_function, "run_summary_turn"),
+        patch.object(lambda_function, "_send_progressive_response"),
+        patch.object(lambda_function, "_persist_session"),
+    )
+    mocks = tuple(patcher.start() for patcher in patchers)
+    yield mocks[0]
+    for patcher in patchers:
+        patcher.stop()
+
+
+@pytest.fixture
+def mock_turn(_summary_patchers):
+    """Per-test view of the patched run_summary_turn, reset and re-armed."""
+    _summary_patchers.reset_mock()
+    _summary_patchers.return_value = (SAMPLE_PAPERS, SAMPLE_SUMMARY, SAMPLE_DETAILS)
+    return _summary_patchers
+
+
+@_summary_params
+def test_summary_can_handle_intent_correto(handler_cls, intent, other_intent, limit):
+    assert handler_cls().can_handle(_intent_input(intent))
+
+
+@_summary_params
+def test_summary_can_handle_rejeita_outro_intent(handler_cls, intent, other_intent, limit):
+    assert not handler_cls().can_handle(_intent_input(other_intent))
+
+
+@_summary_params
+def test_summary_handle_fala_resumo(handler_cls, intent, other_intent, limit, mock_turn):
+    handler_input = _clone_hi()
+    handler_cls().handle(handler_input)
+    assert _last_speech(handler_input) == SAMPLE_SUMMARY
+    assert handler_input.response_builder.asked == 1
+
+
+@_summary_params
+def test_summary_handle_armazena_papers_na_sessao(
+    handler_cls, intent, other_intent, limit, mock_turn,
+):
+    handler_input = _clone_hi()
+    handler_cls().handle(handler_input)
+    assert handler_input.attributes_manager.session_attributes["papers"] == SAMPLE_IDS
+
+
+@_summary_params
+def test_summary_handle_armazena_detalhes_na_sessao(
+    handler_cls, intent, other_intent, limit, mock_turn,
+):
+    handler_input = _clone_hi()
+    handler_cls().handle(handler_input)
+    # O handler guarda a própria lista de detalhes: identidade basta
+    assert handler_input.attributes_manager.session_attributes["details"] is SAMPLE_DETAILS
+
+
+@_summary_params
+def test_summary_handle_usa_limite_correto(
+    handler_cls, intent, other_intent, limit, mock_turn,
+):
+    handler_cls().handle(_clone_hi())
+    mock_turn.assert_called_once_with(limit)
+
+
+@_summary_params
+def test_summary_handle_erro_fetch(handler_cls, intent, other_intent, limit, mock_turn):
+    mock_turn.return_value = ([], "", [])
+    handler_input = _clone_hi()
+    handler_cls().handle(handler_input)
+    assert "Desculpe" in _last_speech(handler_input)
+    assert handler_input.response_builder.asked == 0
+
+
+# ---------------------------------------------------------------------------
+# GetPaperDetailsIntentHandler
+
+
+def _details_session():
+    """Fresh session dict as a summary turn would have left it."""
+    return {"papers": list(SAMPLE_IDS), "details": list(SAMPLE_DETAILS)}
+
+
+def test_details_can_handle_intent_correto():
+    assert GetPaperDetailsIntentHandler().can_handle(_intent_input("GetPaperDetailsIntent"))
+
+
+def test_details_can_handle_rejeita_outro_intent():
+    assert not GetPaperDetailsIntentHandler().can_handle(_intent_input("AMAZON.HelpIntent"))
+
+
+@patch.object(lambda_function, "_restore_session", return_value={})
+def test_details_handle_sem_sessao(mock_restore):
+    handler_input = _clone_hi(slots={"paperNumber": _SLOTS["1"]}, session_attrs={})
+    GetPaperDetailsIntentHandler().handle(handler_input)
+    assert "Ainda não busquei" in _last_speech(handler_input)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("banana", "número de 1 a"),
+    ("0", "número de 1 a"),
+    ("-1", "número de 1 a"),
+    ("99", _N_SAMPLE_PAPERS_STR),
+    (None, "número de 1 a"),
+    ("", "número de 1 a"),
+])
+def test_details_handle_numero_invalido(value, expected):
+    handler_input = _clone_hi(
+        slots={"paperNumber": _SLOTS[value]}, session_attrs=_details_session(),
+    )
+    GetPaperDetailsIntentHandler().handle(handler_input)
+    assert expected in _last_speech(handler_input)
+
+
+def test_details_handle_slot_ausente():
+    handler_input = _clone_hi(slots=None, session_attrs=_details_session())
+    GetPaperDetailsIntentHandler().handle(handler_input)
+    assert "número de 1 a" in _last_speech(handler_input)
+
+
+def test_details_handle_detalhe_do_cache():
+    handler_input = _clone_hi(
+        slots={"paperNumber": _SLOTS["1"]}, session_attrs=_details_session(),
+    )
+    GetPaperDetailsIntentHandler().handle(handler_input)
+    assert _last_speech(handler_input) == SAMPLE_DETAILS[0]
+
+
+@pytest.mark.parametrize("ordinal, index", [("primeiro", 0), ("terceiro", 2)])
+def test_details_handle_ordinal(ordinal, index):
+    handler_input = _clone_hi(
+        slots={"paperNumber": _SLOTS[ordinal]}, session_attrs=_details_session(),
+    )
+    GetPaperDetailsIntentHandler().handle(handler_input)
+    assert _last_speech(handler_input) == SAMPLE_DETAILS[index]
+
+
+@patch.object(lambda_function, "get_paper_details_with_llm", return_value="Detalhe gerado.")
+@patch.object(lambda_function, "_paper_from_id", return_value=SAMPLE_PAPERS[1])
+def test_details_handle_chama_llm_sem_cache(mock_from_id, mock_details):
+    handler_input = _clone_hi(
+        slots={"paperNumber": _SLOTS["2"]},
+        session_attrs={"papers": list(SAMPLE_IDS)},
+    )
+    GetPaperDetailsIntentHandler().handle(handler_input)
+    mock_from_id.assert_called_once_with(SAMPLE_IDS[1])
+    mock_details.assert_called_once_with(SAMPLE_PAPERS[1], 2)
+    assert _last_speech(handler_input) == "Detalhe gerado."
+
+
+@patch.object(lambda_function, "_paper_from_id", return_value=None)
+def test_details_handle_paper_sumiu_do_indice(mock_from_id):
+    handler_input = _clone_hi(
+        slots={"paperNumber": _SLOTS["2"]},
+        session_attrs={"papers": list(SAMPLE_IDS)},
+    )
+    GetPaperDetailsIntentHandler().handle(handler_input)
+    assert "não encontrei" in _last_speech(handler_input)
+
+
+# ---------------------------------------------------------------------------
+# Handlers simples
+
+
+def test_help_can_handle_intent_correto():
+    assert HelpIntentHandler().can_handle(_intent_input("AMAZON.HelpIntent"))
+
+
+def test_help_can_handle_rejeita_outro_intent():
+    assert not HelpIntentHandler().can_handle(_intent_input("AMAZON.StopIntent"))
+
+
+def test_help_handle_explica_uso():
+    handler_input = _make_handler_input()
+    HelpIntentHandler().handle(handler_input)
+    assert "resumir artigos" in _last_speech(handler_input)
+    assert handler_input.response_builder.asked == 1
+
+
+@pytest.mark.parametrize("intent", ["AMAZON.CancelIntent", "AMAZON.StopIntent"])
+def test_cancel_stop_can_handle(intent):
+    assert CancelOrStopIntentHandler().can_handle(_intent_input(intent))
+
+
+def test_cancel_stop_can_handle_rejeita_outro_intent():
+    assert not CancelOrStopIntentHandler().can_handle(_intent_input("AMAZON.HelpIntent"))
+
+
+def test_cancel_stop_handle_despede():
+    handler_input = _make_handler_input()
+    CancelOrStopIntentHandler().handle(handler_input)
+    assert _last_speech(handler_input) == "Até mais!"
+    assert handler_input.response_builder.asked == 0
+
+
+def test_fallback_can_handle_intent_correto():
+    assert FallbackIntentHandler().can_handle(_intent_input("AMAZON.FallbackIntent"))
+
+
+def test_fallback_handle_reorienta():
+    handler_input = _make_handler_input()
+    FallbackIntentHandler().handle(handler_input)
+    assert "Não entendi" in _last_speech(handler_input)
+
+
+def test_session_ended_can_handle():
+    assert SessionEndedRequestHandler().can_handle(_request_input(SessionEndedRequest))
+
+
+def test_session_ended_can_handle_rejeita_intent():
+    assert not SessionEndedRequestHandler().can_handle(_intent_input("AMAZON.HelpIntent"))
+
+
+def test_session_ended_handle_nao_fala_nada():
+    handler_input = _make_handler_input()
+    SessionEndedRequestHandler().handle(handler_input)
+    assert not handler_input.response_builder.spoken
+
+
+def test_catch_all_can_handle_qualquer_excecao():
+    assert CatchAllExceptionHandler().can_handle(_HI_SENTINEL, _ERR)
+
+
+def test_catch_all_handle_pede_desculpas():
+    handler_input = _make_handler_input()
+    CatchAllExceptionHandler().handle(handler_input, _ERR)
+    assert "Desculpe" in _last_speech(handler_input)